@@ -0,0 +1,188 @@
+# Headless Snake core for autopilot / training runs
+# Requires: numpy, numba  (pip install numpy numba)
+# Same rules as snake_game.py (wrap-around moves, static obstacles, shortest-path autopilot),
+# but the board is a uint8 occupancy grid and the snake body a ring buffer, so the whole
+# tick compiles with numba and never touches pygame.
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Plain Python fallback: same results, just without the speedup
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Cell values in the occupancy grid
+EMPTY = 0
+SNAKE = 1
+OBSTACLE = 2
+
+# Directions as (dx, dy) rows, same order as UP, DOWN, LEFT, RIGHT in snake_game.py
+DIRS = np.array([[0, -1], [0, 1], [-1, 0], [1, 0]], dtype=np.int32)
+
+
+@njit(cache=True)
+def bfs(grid, sx, sy, gx, gy):
+    """
+    Finds the shortest path from (sx, sy) to (gx, gy) over EMPTY cells of grid.
+    Uses fixed boundaries like the game's autopilot.
+    Returns an int32[n, 2] array of positions excluding the start, or an empty array if no path found.
+    """
+    width, height = grid.shape
+    came_from = np.full(width * height, -1, dtype=np.int32)  # Flat predecessor map, -1 = unvisited
+    queue = np.empty(width * height, dtype=np.int32)
+    start = sx * height + sy
+    goal = gx * height + gy
+
+    came_from[start] = start
+    queue[0] = start
+    q_head, q_tail = 0, 1
+    found = start == goal
+    while q_head < q_tail and not found:
+        current = queue[q_head]
+        q_head += 1
+        cx, cy = current // height, current % height
+        for d in range(4):
+            nx, ny = cx + DIRS[d, 0], cy + DIRS[d, 1]
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+            nxt = nx * height + ny
+            if came_from[nxt] != -1 or grid[nx, ny] != EMPTY:
+                continue
+            came_from[nxt] = current
+            if nxt == goal:
+                found = True
+                break
+            queue[q_tail] = nxt
+            q_tail += 1
+
+    if not found:
+        return np.empty((0, 2), dtype=np.int32)
+
+    # Walk the predecessors back to the start
+    n = 0
+    current = goal
+    while current != start:
+        n += 1
+        current = came_from[current]
+    path = np.empty((n, 2), dtype=np.int32)
+    current = goal
+    for i in range(n - 1, -1, -1):
+        path[i, 0], path[i, 1] = current // height, current % height
+        current = came_from[current]
+    return path
+
+
+@njit(cache=True)
+def move(grid, body, head_idx, length, target_length, d):
+    """
+    Moves the snake stored in the ring buffer body one cell in direction d (wrap-around).
+    The tail moves out of the way first unless the snake is growing towards target_length.
+    Returns (head_idx, length, collided); on a collision the episode is over and the state is left as is.
+    """
+    capacity = body.shape[0]
+    width, height = grid.shape
+    nx = (body[head_idx, 0] + DIRS[d, 0]) % width
+    ny = (body[head_idx, 1] + DIRS[d, 1]) % height
+
+    if length >= target_length:
+        tail_idx = (head_idx - length + 1) % capacity
+        grid[body[tail_idx, 0], body[tail_idx, 1]] = EMPTY
+        length -= 1
+
+    if grid[nx, ny] != EMPTY:  # Self or obstacle collision
+        return head_idx, length, True
+
+    head_idx = (head_idx + 1) % capacity
+    body[head_idx, 0], body[head_idx, 1] = nx, ny
+    grid[nx, ny] = SNAKE
+    return head_idx, length + 1, False
+
+
+@njit(cache=True)
+def random_free_cell(grid):
+    """Picks a random EMPTY cell as (x, y), or (-1, -1) if the board is full."""
+    free = np.flatnonzero(grid.ravel() == EMPTY)
+    if free.size == 0:
+        return -1, -1
+    idx = free[np.random.randint(free.size)]
+    return idx // grid.shape[1], idx % grid.shape[1]
+
+
+@njit(cache=True)
+def run_episode(grid_size, num_obstacles, max_ticks, seed):
+    """
+    Plays one autopilot game headless.
+    Returns (score, ticks) when the snake crashes, fills the board or max_ticks runs out.
+    """
+    np.random.seed(seed)
+    grid = np.zeros((grid_size, grid_size), dtype=np.uint8)
+    capacity = grid_size * grid_size
+    body = np.empty((capacity, 2), dtype=np.int32)
+
+    # Start in the middle of the grid
+    mid = grid_size // 2
+    body[0, 0], body[0, 1] = mid, mid
+    grid[mid, mid] = SNAKE
+    head_idx, length, target_length = 0, 1, 1
+    d = np.random.randint(4)
+
+    # Obstacles, kept out of the 5x5 area around the spawn
+    placed = 0
+    while placed < num_obstacles:
+        x, y = np.random.randint(grid_size), np.random.randint(grid_size)
+        if (abs(x - mid) <= 2 and abs(y - mid) <= 2) or grid[x, y] != EMPTY:
+            continue
+        grid[x, y] = OBSTACLE
+        placed += 1
+
+    fx, fy = random_free_cell(grid)
+    path = np.empty((0, 2), dtype=np.int32)
+    path_i = 0
+    score = 0
+
+    for tick in range(max_ticks):
+        hx, hy = body[head_idx, 0], body[head_idx, 1]
+
+        if path_i >= path.shape[0]:  # No path or path completed, find new one
+            # The tail will move out of the way, so it is free for planning
+            tail_idx = (head_idx - length + 1) % capacity
+            tx, ty = body[tail_idx, 0], body[tail_idx, 1]
+            if length > 1:
+                grid[tx, ty] = EMPTY
+            path = bfs(grid, hx, hy, fx, fy)
+            if length > 1:
+                grid[tx, ty] = SNAKE
+            path_i = 0
+
+        if path_i < path.shape[0]:  # Follow the path (steps never wrap, boundaries are fixed)
+            dx, dy = path[path_i, 0] - hx, path[path_i, 1] - hy
+            path_i += 1
+            for k in range(4):
+                if DIRS[k, 0] == dx and DIRS[k, 1] == dy:
+                    d = k
+        else:
+            # No path to food, keep going if safe or take any safe neighbour (survival instinct)
+            nx, ny = (hx + DIRS[d, 0]) % grid_size, (hy + DIRS[d, 1]) % grid_size
+            if grid[nx, ny] != EMPTY:
+                for k in range(4):
+                    nx, ny = (hx + DIRS[k, 0]) % grid_size, (hy + DIRS[k, 1]) % grid_size
+                    if grid[nx, ny] == EMPTY:
+                        d = k
+                        break
+
+        head_idx, length, collided = move(grid, body, head_idx, length, target_length, d)
+        if collided:
+            return score, tick + 1
+
+        if body[head_idx, 0] == fx and body[head_idx, 1] == fy:  # Snake ate food
+            score += 1
+            target_length += 1
+            fx, fy = random_free_cell(grid)
+            if fx < 0:  # Board is full
+                return score, tick + 1
+            path_i = path.shape[0]  # Recalculate path after eating
+
+    return score, max_ticks
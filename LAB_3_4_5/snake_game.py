@@ -1,12 +1,28 @@
+# Snake Game with Obstacles & A* Autopilot
+# Requires: pygame-ce  (pip install pygame-ce)
+# pygame-ce is a drop-in replacement for pygame with faster draw/blit paths;
+# plain pygame still works, just without the CE-only fast paths.
+
 import pygame
 import random
 import collections
+import functools
+import heapq
+import itertools
+
+PYGAME_CE = getattr(pygame, "IS_CE", False)  # True when running on pygame-ce
 
 # --- Game Configuration ---
 GRID_SIZE = 20  # Number of cells in width and height
 CELL_SIZE = 30  # Size of each cell in pixels
 SCREEN_WIDTH = GRID_SIZE * CELL_SIZE
 SCREEN_HEIGHT = GRID_SIZE * CELL_SIZE + 60  # Extra space for score and status
+NUM_OBSTACLES = 5  # Adjust as needed
+RENDER = True  # False runs the autopilot headless on the numba core in snake_core.py
+
+# Pre-built rect for every grid cell, indexed as _CELL_RECTS[x][y] (draw calls only read them)
+_CELL_RECTS = [[pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE) for y in range(GRID_SIZE)]
+               for x in range(GRID_SIZE)]
 
 # Colors
 COLOR_BACKGROUND = (40, 40, 40)  # Dark Gray
@@ -26,6 +42,15 @@ UP = (0, -1)
 DOWN = (0, 1)
 LEFT = (-1, 0)
 RIGHT = (1, 0)
+_DIRS = (UP, DOWN, LEFT, RIGHT)
+# Raw (next - head) step -> direction, including steps that wrap across the screen edge
+_STEP_TO_DIR = {d: d for d in _DIRS}
+_STEP_TO_DIR.update({(GRID_SIZE - 1, 0): LEFT, (-(GRID_SIZE - 1), 0): RIGHT,
+                     (0, GRID_SIZE - 1): UP, (0, -(GRID_SIZE - 1)): DOWN})
+
+# Autopilot path memoization (LRU): (head, food, body, obstacles) -> path tuple
+PATH_CACHE_SIZE = 512
+_path_cache = collections.OrderedDict()
 
 
 # --- Helper Functions ---
@@ -37,25 +62,112 @@ def draw_grid(surface):
         pygame.draw.line(surface, COLOR_GRID, (0, y), (SCREEN_WIDTH, y))
 
 
+def make_tile(fill_color, border_color, border_width):
+    """Pre-renders one CELL_SIZE x CELL_SIZE cell (fill + border) so it can be blitted instead of drawn."""
+    tile = pygame.Surface((CELL_SIZE, CELL_SIZE)).convert()
+    tile.fill(fill_color)
+    pygame.draw.rect(tile, border_color, tile.get_rect(), border_width)
+    return tile
+
+
+def blit_tiles(surface, tile, positions):
+    """Blits the same tile at every grid position with one batched call."""
+    blit_sequence = [(tile, _CELL_RECTS[p[0]][p[1]]) for p in positions]
+    if PYGAME_CE:
+        surface.fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)
+
+
 def get_random_position(snake_body, obstacles, food_pos=None):
-    """Gets a random position on the grid not occupied by snake, obstacles, or existing food."""
+    """Gets a random position on the grid not occupied by snake, obstacles, or existing food.
+    snake_body and obstacles should be sets so each membership test is O(1).
+    """
     while True:
         pos = (random.randint(0, GRID_SIZE - 1), random.randint(0, GRID_SIZE - 1))
         if pos not in snake_body and pos not in obstacles and (food_pos is None or pos != food_pos):
             return pos
 
 
+# Occupancy grid cell values
+EMPTY = 0
+SNAKE = 1
+OBSTACLE = 2
+
+
+class Board:
+    """
+    Occupancy grid of the playfield, indexed as grid[x][y] and holding EMPTY/SNAKE/OBSTACLE,
+    so every collision test is a single indexed read.
+    The free cells are also kept as a list plus a cell -> index map so random picks are O(1),
+    even when the board is nearly full and rejection sampling would keep missing.
+    """
+
+    def __init__(self):
+        self.grid = [bytearray(GRID_SIZE) for _ in range(GRID_SIZE)]
+        self._free = []
+        self._index = {}
+
+    def reset(self, snake_positions, obstacle_positions):
+        """Rebuilds the grid and the free cells from the snake and obstacle positions."""
+        self.grid = [bytearray(GRID_SIZE) for _ in range(GRID_SIZE)]
+        for x, y in snake_positions:
+            self.grid[x][y] = SNAKE
+        for x, y in obstacle_positions:
+            self.grid[x][y] = OBSTACLE
+        self._free = [(x, y) for x in range(GRID_SIZE) for y in range(GRID_SIZE) if self.grid[x][y] == EMPTY]
+        self._index = {cell: i for i, cell in enumerate(self._free)}
+
+    def occupy(self, cell, value):
+        """Marks cell as taken by value (SNAKE or OBSTACLE)."""
+        self.grid[cell[0]][cell[1]] = value
+        self._remove_free(cell)
+
+    def release(self, cell):
+        """Marks cell as EMPTY again."""
+        self.grid[cell[0]][cell[1]] = EMPTY
+        self._add_free(cell)
+
+    def random_position(self, exclude=None):
+        """Picks a random free cell, other than exclude (e.g. the current food position)."""
+        if exclude in self._index:
+            self._remove_free(exclude)
+            pos = random.choice(self._free)
+            self._add_free(exclude)
+            return pos
+        return random.choice(self._free)
+
+    def _add_free(self, cell):
+        if cell not in self._index:
+            self._index[cell] = len(self._free)
+            self._free.append(cell)
+
+    def _remove_free(self, cell):
+        i = self._index.pop(cell, None)
+        if i is None:
+            return
+        last = self._free.pop()
+        if i < len(self._free):  # Swap the last free cell into the hole
+            self._free[i] = last
+            self._index[last] = i
+
+
+_board = Board()  # Kept in sync by Snake.move and reset_game_state
+
+
 # --- Snake Class ---
 class Snake:
     def __init__(self):
         self.reset()
+        self._head_tile = make_tile(self.head_color, COLOR_SNAKE, 3)  # Border for head
+        self._body_tile = make_tile(self.color, self.head_color, 1)  # Thinner border for body
 
     def reset(self):
         """Resets the snake to its initial state."""
         self.length = 1
         # Start in the middle of the grid
-        self.positions = [((GRID_SIZE // 2), (GRID_SIZE // 2))]
-        self.direction = random.choice([UP, DOWN, LEFT, RIGHT])
+        self.positions = collections.deque([((GRID_SIZE // 2), (GRID_SIZE // 2))])
+        self.direction = random.choice(_DIRS)
         self.color = COLOR_SNAKE
         self.head_color = COLOR_SNAKE_HEAD
         self.score = 0
@@ -72,18 +184,26 @@ class Snake:
             self.direction = point
 
     def move(self):
-        """Moves the snake in its current direction."""
+        """Moves the snake in its current direction. Returns True if it ran into itself or an obstacle."""
         cur = self.get_head_position()
         x, y = self.direction
         new_head = (((cur[0] + x) % GRID_SIZE), ((cur[1] + y) % GRID_SIZE))  # Wrap around screen
 
-        # Check for collision with self
-        if len(self.positions) > 2 and new_head in self.positions[2:]:
+        # The tail moves out of the way first unless the snake is growing
+        tail = None
+        if len(self.positions) >= self.length:
+            tail = self.positions.pop()
+            _board.release(tail)
+
+        # Check for collision with self or obstacles
+        if _board.grid[new_head[0]][new_head[1]] != EMPTY:
+            if tail is not None:  # Leave the snake as it was for the game over screen
+                self.positions.append(tail)
+                _board.occupy(tail, SNAKE)
             return True  # Collision occurred
 
-        self.positions.insert(0, new_head)
-        if len(self.positions) > self.length:
-            self.positions.pop()
+        self.positions.appendleft(new_head)
+        _board.occupy(new_head, SNAKE)
         return False  # No collision
 
     def grow(self):
@@ -93,30 +213,31 @@ class Snake:
 
     def draw(self, surface):
         """Draws the snake on the game surface."""
-        for i, p in enumerate(self.positions):
-            r = pygame.Rect((p[0] * CELL_SIZE, p[1] * CELL_SIZE), (CELL_SIZE, CELL_SIZE))
-            if i == 0:  # Head
-                pygame.draw.rect(surface, self.head_color, r)
-                pygame.draw.rect(surface, COLOR_SNAKE, r, 3)  # Border for head
-            else:  # Body
-                pygame.draw.rect(surface, self.color, r)
-                pygame.draw.rect(surface, self.head_color, r, 1)  # Thinner border for body
+        # Body first, batched into a single call
+        blit_tiles(surface, self._body_tile, itertools.islice(self.positions, 1, None))
+
+        # Head
+        head = self.positions[0]
+        surface.blit(self._head_tile, _CELL_RECTS[head[0]][head[1]])
 
 
 # --- Food Class ---
 class Food:
-    def __init__(self, snake_body, obstacles):
+    def __init__(self):
         self.color = COLOR_FOOD
-        self.position = get_random_position(snake_body, obstacles)
+        self.position = _board.random_position()
+        # Circle on a transparent tile so the grid still shows in the corners
+        self._tile = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.ellipse(self._tile, self.color, self._tile.get_rect())
 
-    def randomize_position(self, snake_body, obstacles):
-        """Places the food at a new random position."""
-        self.position = get_random_position(snake_body, obstacles, self.position)
+    def randomize_position(self):
+        """Places the food at a new random free position."""
+        _path_cache.clear()  # Cached paths all lead to the old food position
+        self.position = _board.random_position(self.position)
 
     def draw(self, surface):
         """Draws the food on the game surface."""
-        r = pygame.Rect((self.position[0] * CELL_SIZE, self.position[1] * CELL_SIZE), (CELL_SIZE, CELL_SIZE))
-        pygame.draw.ellipse(surface, self.color, r)  # Draw as a circle/ellipse
+        surface.blit(self._tile, _CELL_RECTS[self.position[0]][self.position[1]])
 
 
 # --- Obstacle Class ---
@@ -124,90 +245,117 @@ class Obstacles:
     def __init__(self, num_obstacles, snake_body):
         self.color = COLOR_OBSTACLE
         self.positions = []
+        self.position_set = frozenset()
         self.num_obstacles = num_obstacles
+        self._tile = make_tile(self.color, COLOR_BACKGROUND, 2)
         self.generate_obstacles(snake_body)
 
     def generate_obstacles(self, snake_body):
         """Generates a set of obstacles."""
         self.positions = []
         # Ensure obstacles are not too close to the initial snake position
-        safe_spawn_area_for_snake = set()
+        safe_spawn_area_for_snake = set(snake_body)
         head = snake_body[0]
         for dx in range(-2, 3):
             for dy in range(-2, 3):
                 safe_spawn_area_for_snake.add((head[0] + dx, head[1] + dy))
 
+        placed = set()
         for _ in range(self.num_obstacles):
-            pos = get_random_position(snake_body + list(safe_spawn_area_for_snake), self.positions)
+            pos = get_random_position(safe_spawn_area_for_snake, placed)
             self.positions.append(pos)
+            placed.add(pos)
+        self.position_set = frozenset(self.positions)  # Hashable set for pathfinding and its cache key
 
     def draw(self, surface):
         """Draws the obstacles on the game surface."""
-        for p in self.positions:
-            r = pygame.Rect((p[0] * CELL_SIZE, p[1] * CELL_SIZE), (CELL_SIZE, CELL_SIZE))
-            pygame.draw.rect(surface, self.color, r)
-            pygame.draw.rect(surface, COLOR_BACKGROUND, r, 2)  # Border
+        blit_tiles(surface, self._tile, self.positions)
 
 
-# --- BFS Autopilot ---
-def bfs_pathfinding(start_pos, target_pos, snake_body, obstacles):
+# --- A* Autopilot ---
+def a_star_pathfinding(start_pos, target_pos, snake_body_set, obstacles_set):
     """
-    Finds the shortest path from start_pos to target_pos using BFS.
-    Avoids snake_body and obstacles.
+    Finds the shortest path from start_pos to target_pos using A* with a Manhattan distance heuristic.
+    Avoids snake_body_set and obstacles_set (both sets/frozensets of positions).
     Returns a list of positions representing the path, or an empty list if no path found.
     """
-    queue = collections.deque([[start_pos]])
-    visited = {start_pos}
+    blocked = snake_body_set | obstacles_set  # Single hash lookup per neighbour
+    target_x, target_y = target_pos
 
-    # The grid for BFS considers the snake's body (except its current head, which will move)
-    # and obstacles as blocked.
-    # When considering next moves, the snake's *future* head position is what matters.
-    # The current snake body (excluding the tail if it moves) becomes an obstacle for the *next* step.
+    # The search considers the snake's body (except its tail, which will move away; the caller
+    # already leaves it out of snake_body_set) and obstacles as blocked.
+    # Moves don't wrap, so plain Manhattan distance is an admissible, consistent heuristic.
+    tie_breaker = itertools.count()  # Keeps heap order stable for equal f-scores
+    start_h = abs(start_pos[0] - target_x) + abs(start_pos[1] - target_y)
+    open_heap = [(start_h, next(tie_breaker), 0, start_pos)]
+    came_from = {start_pos: None}
+    g_score = {start_pos: 0}
 
-    while queue:
-        path = queue.popleft()
-        current_head = path[-1]
+    while open_heap:
+        _, _, g, current_head = heapq.heappop(open_heap)
 
         if current_head == target_pos:
-            return path[1:]  # Return path excluding the current head itself
-
-        for dx, dy in [UP, DOWN, LEFT, RIGHT]:
+            # Walk the predecessors back to the start, excluding the current head itself
+            path = []
+            while current_head != start_pos:
+                path.append(current_head)
+                current_head = came_from[current_head]
+            path.reverse()
+            return path
+
+        if g > g_score[current_head]:
+            continue  # Stale heap entry, a shorter route was already found
+
+        next_g = g + 1
+        for dx, dy in _DIRS:
             next_x, next_y = current_head[0] + dx, current_head[1] + dy
 
-            # Check boundaries (though snake wraps, BFS might be better with fixed boundaries for pathing)
+            # Check boundaries (though snake wraps, pathing uses fixed boundaries)
             if not (0 <= next_x < GRID_SIZE and 0 <= next_y < GRID_SIZE):
                 continue
 
             next_pos = (next_x, next_y)
-
-            # Check collision with obstacles or snake's body
-            # For BFS, the snake's body (except its tail, which will move away) is an obstacle.
-            # The critical part is that the *entire* snake body (as it would be *after* the move)
-            # should not collide with the `next_pos`.
-            # A simpler BFS: treat all current snake segments (except perhaps the tail if it's about to move) as obstacles.
-            if next_pos in visited or next_pos in obstacles or next_pos in snake_body[
-                                                                           :-1]:  # snake_body[:-1] to allow moving into tail's old spot
+            if next_pos in blocked:
                 continue
+            if next_pos in g_score and g_score[next_pos] <= next_g:
+                continue  # Already reached at least as cheaply
 
-            new_path = list(path)
-            new_path.append(next_pos)
-            queue.append(new_path)
-            visited.add(next_pos)
+            g_score[next_pos] = next_g
+            came_from[next_pos] = current_head
+            f = next_g + abs(next_x - target_x) + abs(next_y - target_y)
+            heapq.heappush(open_heap, (f, next(tie_breaker), next_g, next_pos))
 
     return []  # No path found
 
 
-# --- Main Game ---
-def game_loop():
-    pygame.init()
-    pygame.font.init()  # Initialize font module
-
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32)
-    pygame.display.set_caption("Fantastic Snake Game")
-    surface = pygame.Surface(screen.get_size())
-    surface = surface.convert()  # For performance
-
-    font_path = None  # Let Pygame find a default system font if "PressStart2P" is not available
+def cached_pathfinding(start_pos, target_pos, snake_body_set, obstacles_set):
+    """
+    Memoized wrapper around a_star_pathfinding.
+    Obstacles are static and the food stays put between meals, so repeated queries are common.
+    Returns a fresh deque the caller is free to consume from the left.
+    """
+    key = (start_pos, target_pos, snake_body_set, obstacles_set)
+    path = _path_cache.get(key)
+    if path is not None:
+        _path_cache.move_to_end(key)
+        return collections.deque(path)
+
+    path = tuple(a_star_pathfinding(start_pos, target_pos, snake_body_set, obstacles_set))
+    _path_cache[key] = path
+    if len(_path_cache) > PATH_CACHE_SIZE:
+        _path_cache.popitem(last=False)  # Evict least recently used
+    return collections.deque(path)
+
+
+# --- Fonts ---
+@functools.lru_cache(maxsize=1)
+def resolve_font_path():
+    """
+    Looks up the retro font once; get_fonts()/match_font() hit the OS font cache,
+    so re-entering game_loop reuses the cached result.
+    Returns None to let Pygame pick a default system font if "PressStart2P" is not available.
+    """
+    font_path = None
     try:
         # Attempt to use a specific retro font if available (e.g., place PressStart2P-Regular.ttf in same dir)
         # pygame.font.get_fonts() can show available system fonts
@@ -224,6 +372,25 @@ def game_loop():
     except Exception as e:
         print(f"Font loading error: {e}. Using default system font.")
         font_path = None
+    return font_path
+
+
+# --- Main Game ---
+def game_loop():
+    pygame.init()
+    pygame.font.init()  # Initialize font module
+
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32)
+    pygame.display.set_caption("Fantastic Snake Game")
+    surface = pygame.Surface(screen.get_size())
+    surface = surface.convert()  # For performance
+
+    # The background and grid never change, so render them once and blit every frame
+    background = pygame.Surface(screen.get_size()).convert()
+    background.fill(COLOR_BACKGROUND)
+    draw_grid(background)
+
+    font_path = resolve_font_path()
 
     try:
         score_font = pygame.font.Font(font_path, 24)  # Larger for score
@@ -240,26 +407,32 @@ def game_loop():
     clock = pygame.time.Clock()
 
     snake = Snake()
-    num_initial_obstacles = 5  # Adjust as needed
-    obstacles = Obstacles(num_initial_obstacles, snake.positions)
-    food = Food(snake.positions, obstacles.positions)
+    obstacles = Obstacles(NUM_OBSTACLES, snake.positions)
+    _board.reset(snake.positions, obstacles.positions)
+    food = Food()
 
     game_over = False
     autopilot_on = False
-    autopilot_path = []
+    autopilot_path = collections.deque()
 
     # --- Initial Game State Setup ---
     def reset_game_state():
         nonlocal snake, obstacles, food, game_over, autopilot_path, autopilot_on
         snake.reset()
         obstacles.generate_obstacles(snake.positions)  # Regenerate obstacles away from new snake
-        food.randomize_position(snake.positions, obstacles.positions)
+        _board.reset(snake.positions, obstacles.positions)
+        _path_cache.clear()
+        food.randomize_position()
         game_over = False
-        autopilot_path = []
+        autopilot_path = collections.deque()
         # autopilot_on = False # Optionally reset autopilot state too
 
     reset_game_state()  # Initial setup
 
+    # Text surfaces are cached and only re-rendered when the value they show changes
+    rendered_score = None
+    rendered_autopilot = None
+
     # --- Game Loop ---
     while True:
         for event in pygame.event.get():
@@ -282,24 +455,32 @@ def game_loop():
                             snake.turn(RIGHT)
                     if event.key == pygame.K_a:  # Toggle Autopilot
                         autopilot_on = not autopilot_on
-                        autopilot_path = []  # Clear path on toggle
+                        autopilot_path = collections.deque()  # Clear path on toggle
                     if event.key == pygame.K_ESCAPE:  # Quit game
                         pygame.quit()
                         return
 
         if not game_over:
-            collision_with_self = False
             if autopilot_on:
-                if not autopilot_path:  # If no path or path completed, find new one
-                    # Important: For BFS, the snake's body to avoid is all current segments
+                if autopilot_path:
+                    # Obstacles are static and only the tail moves, so the remaining path usually stays valid.
+                    # Keep following it unless one of its cells is now blocked.
+                    tail = snake.positions[-1] if snake.length > 1 else None
+                    for path_pos in autopilot_path:
+                        if _board.grid[path_pos[0]][path_pos[1]] != EMPTY and path_pos != tail:
+                            autopilot_path = collections.deque()  # Invalidated, replan below
+                            break
+
+                if not autopilot_path:  # If no path, path completed or path invalidated, find new one
+                    # Important: For pathfinding, the snake's body to avoid is all current segments
                     # *except* the tail, because the tail will move out of the way.
                     # If the snake is very short (length 1 or 2), this needs care.
-                    body_to_avoid_for_bfs = snake.positions
+                    body_to_avoid = frozenset(snake.positions)
                     if snake.length > 1:
-                        body_to_avoid_for_bfs = snake.positions[:-1]
+                        body_to_avoid = body_to_avoid - {snake.positions[-1]}
 
-                    path_to_food = bfs_pathfinding(snake.get_head_position(), food.position, body_to_avoid_for_bfs,
-                                                   obstacles.positions)
+                    path_to_food = cached_pathfinding(snake.get_head_position(), food.position,
+                                                      body_to_avoid, obstacles.position_set)
 
                     if path_to_food:
                         autopilot_path = path_to_food
@@ -308,9 +489,9 @@ def game_loop():
                         # Find any adjacent valid square not hitting self or obstacle
                         head = snake.get_head_position()
                         possible_moves = []
-                        for dx_safe, dy_safe in [UP, DOWN, LEFT, RIGHT]:
+                        for dx_safe, dy_safe in _DIRS:
                             next_safe_pos = ((head[0] + dx_safe) % GRID_SIZE, (head[1] + dy_safe) % GRID_SIZE)
-                            if next_safe_pos not in snake.positions and next_safe_pos not in obstacles.positions:
+                            if _board.grid[next_safe_pos[0]][next_safe_pos[1]] == EMPTY:
                                 # Optional: Prefer moves that don't immediately reverse current direction unless necessary
                                 if snake.length > 1 and (dx_safe, dy_safe) == (
                                 snake.direction[0] * -1, snake.direction[1] * -1):
@@ -324,63 +505,47 @@ def game_loop():
                                 snake.turn(snake.direction)
                             else:
                                 snake.turn(random.choice(possible_moves))
-                            autopilot_path = []  # No specific path, just one safe step
+                            autopilot_path = collections.deque()  # No specific path, just one safe step
                         else:
                             # Truly stuck, will likely lead to game over in next move if no safe spot
-                            autopilot_path = []
+                            autopilot_path = collections.deque()
 
                 if autopilot_path:  # If there's a path to follow
-                    next_move_pos = autopilot_path.pop(0)
+                    next_move_pos = autopilot_path.popleft()
                     head_pos = snake.get_head_position()
-                    dx = next_move_pos[0] - head_pos[0]
-                    dy = next_move_pos[1] - head_pos[1]
-
-                    # Handle wrap-around for dx, dy calculation if next_move_pos is across the screen edge
-                    if dx > 1:
-                        dx = -1
-                    elif dx < -1:
-                        dx = 1
-                    if dy > 1:
-                        dy = -1
-                    elif dy < -1:
-                        dy = 1
+                    step = (next_move_pos[0] - head_pos[0], next_move_pos[1] - head_pos[1])
 
-                    snake.turn((dx, dy))
+                    # The lookup also handles wrap-around if next_move_pos is across the screen edge
+                    snake.turn(_STEP_TO_DIR.get(step, snake.direction))
 
-            collision_with_self = snake.move()  # Move snake and check self-collision
-
-            # Check collision with obstacles
-            if snake.get_head_position() in obstacles.positions:
-                game_over = True
-
-            # Check collision with self (again, move might have caused it)
-            if collision_with_self:  # snake.move() now returns True on self-collision
+            if snake.move():  # Move snake; returns True on collision with self or obstacles
                 game_over = True
-
-            # Check if snake ate food
-            if snake.get_head_position() == food.position:
+            elif snake.positions[0] == food.position:  # Check if snake ate food
                 snake.grow()
-                food.randomize_position(snake.positions, obstacles.positions)
-                autopilot_path = []  # Recalculate path after eating
+                food.randomize_position()
+                autopilot_path = collections.deque()  # Recalculate path after eating
 
         # --- Drawing ---
-        surface.fill(COLOR_BACKGROUND)
-        draw_grid(surface)  # Draw grid lines underneath other elements
+        surface.blit(background, (0, 0))  # Pre-rendered fill + grid lines underneath other elements
 
         snake.draw(surface)
         food.draw(surface)
         obstacles.draw(surface)
 
         # Draw Score
-        score_text_surf = score_font.render(f"SCORE: {snake.score}", True, COLOR_SCORE_TEXT)
-        score_rect = score_text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 45))
+        if rendered_score != snake.score:
+            rendered_score = snake.score
+            score_text_surf = score_font.render(f"SCORE: {snake.score}", True, COLOR_SCORE_TEXT)
+            score_rect = score_text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 45))
         surface.blit(score_text_surf, score_rect)
 
         # Draw Autopilot Status
-        autopilot_status_text = "AUTOPILOT: ON" if autopilot_on else "AUTOPILOT: OFF"
-        autopilot_status_color = COLOR_AUTOPILOT_ON if autopilot_on else COLOR_AUTOPILOT_OFF
-        autopilot_surf = status_font.render(autopilot_status_text, True, autopilot_status_color)
-        autopilot_rect = autopilot_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 18))
+        if rendered_autopilot != autopilot_on:
+            rendered_autopilot = autopilot_on
+            autopilot_status_text = "AUTOPILOT: ON" if autopilot_on else "AUTOPILOT: OFF"
+            autopilot_status_color = COLOR_AUTOPILOT_ON if autopilot_on else COLOR_AUTOPILOT_OFF
+            autopilot_surf = status_font.render(autopilot_status_text, True, autopilot_status_color)
+            autopilot_rect = autopilot_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 18))
         surface.blit(autopilot_surf, autopilot_rect)
 
         if game_over:
@@ -402,8 +567,7 @@ def game_loop():
             surface.blit(restart_text, restart_rect)
 
         screen.blit(surface, (0, 0))
-        pygame.display.flip()  # Use flip for full screen update
-        pygame.display.update()  # Or update specific rects if optimizing later
+        pygame.display.flip()  # Single full screen present per frame
 
         # Control game speed
         # Speed can be increased based on score for progressive difficulty
@@ -411,5 +575,21 @@ def game_loop():
         clock.tick(min(game_speed, 30))  # Cap speed at 30 FPS
 
 
+# --- Headless Mode ---
+def headless_loop(episodes=10, max_ticks=100_000):
+    """Runs autopilot episodes without pygame and reports score and tick rate for each."""
+    import time
+    import snake_core  # numpy/numba are only needed for headless runs
+
+    for episode in range(episodes):
+        start = time.perf_counter()
+        score, ticks = snake_core.run_episode(GRID_SIZE, NUM_OBSTACLES, max_ticks, episode)
+        elapsed = time.perf_counter() - start
+        print(f"Episode {episode}: score {score}, {ticks} ticks, {ticks / elapsed:,.0f} ticks/s")
+
+
 if __name__ == '__main__':
-    game_loop()
\ No newline at end of file
+    if RENDER:
+        game_loop()
+    else:
+        headless_loop()